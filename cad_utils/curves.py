@@ -7,34 +7,27 @@ from .macro import LINE_IDX, CIRCLE_IDX, ARC_IDX, PAD_VAL, N_ARGS_EXT, N_ARGS
 
 
 def construct_curve_from_dict(stat):
-    if stat['type'] == "Line3D":
-        return Line.from_dict(stat)
-    elif stat['type'] == "Circle3D":
-        return Circle.from_dict(stat)
-    elif stat['type'] == "Arc3D":
-        return Arc.from_dict(stat)
-    else:
+    curve_cls = _CURVE_BY_JSON_TYPE.get(stat['type'])
+    if curve_cls is None:
         raise NotImplementedError("curve type not supported yet: {}".format(stat['type']))
+    return curve_cls.from_dict(stat)
 
 
 def construct_curve_from_vector(vec, start_point, is_numerical=True):
-    type = vec[0]
-    if type == LINE_IDX:
-        return Line.from_vector(vec, start_point, is_numerical=is_numerical)
-    elif type == CIRCLE_IDX:
-        return Circle.from_vector(vec, start_point, is_numerical=is_numerical)
-    elif type == ARC_IDX:
-        res = Arc.from_vector(vec, start_point, is_numerical=is_numerical)
-        if res is None: # for visualization purpose, replace illed arc with line
-            return Line.from_vector(vec, start_point, is_numerical=is_numerical)
-        return res
-    else:
+    curve_cls = _CURVE_BY_COMMAND.get(vec[0])
+    if curve_cls is None:
         raise NotImplementedError("curve type not supported yet: command idx {}".format(vec[0]))
+    res = curve_cls.from_vector(vec, start_point, is_numerical=is_numerical)
+    if res is None: # for visualization purpose, replace illed arc with line
+        return Line.from_vector(vec, start_point, is_numerical=is_numerical)
+    return res
 
 
 #######################  base  #######################
 class CurveBase(object):
     """Base class for curve. All types of curves shall inherit from this."""
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -88,6 +81,8 @@ class CurveBase(object):
 
 ####################### curves #######################
 class Line(CurveBase):
+    __slots__ = ("start_point", "end_point")
+
     def __init__(self, start_point, end_point):
         super(Line, self).__init__()
         self.start_point = start_point
@@ -156,6 +151,9 @@ class Line(CurveBase):
 
 
 class Arc(CurveBase):
+    __slots__ = ("start_point", "end_point", "center", "radius", "normal",
+                 "start_angle", "end_angle", "ref_vec", "mid_point")
+
     def __init__(self, start_point, end_point, center, radius,
                  normal=None, start_angle=None, end_angle=None, ref_vec=None):
         super(Arc, self).__init__()
@@ -343,6 +341,8 @@ class Arc(CurveBase):
 
 
 class Circle(CurveBase):
+    __slots__ = ("center", "radius", "normal")
+
     def __init__(self, center, radius, normal=None):
         super(Circle, self).__init__()
         self.center = center
@@ -417,3 +417,8 @@ class Circle(CurveBase):
         angles = np.linspace(0, np.pi * 2, num=n, endpoint=False)
         points = np.stack([np.cos(angles), np.sin(angles)], axis=1) * self.radius + self.center[np.newaxis]
         return points
+
+
+# curve class lookup tables, used by construct_curve_from_dict / construct_curve_from_vector
+_CURVE_BY_JSON_TYPE = {"Line3D": Line, "Circle3D": Circle, "Arc3D": Arc}
+_CURVE_BY_COMMAND = {LINE_IDX: Line, CIRCLE_IDX: Circle, ARC_IDX: Arc}
@@ -9,6 +9,8 @@ from .math_utils import cartesian2polar, polar2cartesian, polar_parameterization
 
 class CoordSystem(object):
     """Local coordinate system for sketch_inventor plane."""
+    __slots__ = ("origin", "_theta", "_phi", "_gamma", "_y_axis", "is_numerical", "_axes")
+
     def __init__(self, origin, theta, phi, gamma, y_axis=None, is_numerical=False):
         self.origin = origin
         self._theta = theta # 0~pi
@@ -16,21 +18,31 @@ class CoordSystem(object):
         self._gamma = gamma # -pi~pi
         self._y_axis = y_axis # (theta, phi)
         self.is_numerical = is_numerical
+        self._axes = None # cached 3x3 frame (rows: normal, x_axis, y_axis), reset whenever the angles change
+
+    def _get_axes(self):
+        if self._axes is None:
+            normal_3d, x_axis_3d = polar_parameterization_inverse(self._theta, self._phi, self._gamma)
+            if self._y_axis is None:
+                y_axis_3d = np.cross(normal_3d, x_axis_3d)
+            else:
+                y_axis_3d = polar2cartesian(self._y_axis)
+            axes = np.stack([normal_3d, x_axis_3d, y_axis_3d], axis=0)
+            axes.flags.writeable = False # rows are handed out directly, guard the cache
+            self._axes = axes
+        return self._axes
 
     @property
     def normal(self):
-        return polar2cartesian([self._theta, self._phi])
+        return self._get_axes()[0]
 
     @property
     def x_axis(self):
-        normal_3d, x_axis_3d = polar_parameterization_inverse(self._theta, self._phi, self._gamma)
-        return x_axis_3d
+        return self._get_axes()[1]
 
     @property
     def y_axis(self):
-        if self._y_axis is None:
-            return np.cross(self.normal, self.x_axis)
-        return polar2cartesian(self._y_axis)
+        return self._get_axes()[2]
 
     @staticmethod
     def from_dict(stat):
@@ -64,12 +76,14 @@ class CoordSystem(object):
         tmp = np.array([self._theta, self._phi, self._gamma])
         self._theta, self._phi, self._gamma = ((tmp / np.pi + 1.0) / 2 * n).round().clip(
             min=0, max=n-1).astype(np.int)
+        self._axes = None
         self.is_numerical = True
 
     def denumericalize(self, n=256):
         self.origin = self.origin / n * 2 - 1.0
         tmp = np.array([self._theta, self._phi, self._gamma])
         self._theta, self._phi, self._gamma = (tmp / n * 2 - 1.0) * np.pi
+        self._axes = None
         self.is_numerical = False
 
     def to_vector(self):
@@ -79,6 +93,9 @@ class CoordSystem(object):
 class Extrude(object):
     """Single extrude operation with corresponding a sketch_inventor profile.
     NOTE: only support single sketch_inventor profile. Extrusion with multiple profiles is decomposed."""
+    __slots__ = ("profile", "sketch_plane", "operation", "extent_type", "extent_one", "extent_two",
+                 "sketch_pos", "sketch_size")
+
     def __init__(self, profile: Profile, sketch_plane: CoordSystem,
                  operation, extent_type, extent_one, extent_two, sketch_pos, sketch_size):
         """
@@ -166,13 +183,13 @@ class Extrude(object):
         return res
 
     def __str__(self):
-        s = "Sketch-Extrude pair:"
-        s += "\n  -" + str(self.sketch_plane)
-        s += "\n  -sketch_inventor position: {}, sketch_inventor size: {}".format(self.sketch_pos.round(4), self.sketch_size.round(4))
-        s += "\n  -operation:{}, type:{}, extent_one:{}, extent_two:{}".format(
-            self.operation, self.extent_type, self.extent_one.round(4), self.extent_two.round(4))
-        s += "\n  -" + str(self.profile)
-        return s
+        return "\n  -".join([
+            "Sketch-Extrude pair:",
+            str(self.sketch_plane),
+            "sketch_inventor position: {}, sketch_inventor size: {}".format(self.sketch_pos.round(4), self.sketch_size.round(4)),
+            "operation:{}, type:{}, extent_one:{}, extent_two:{}".format(
+                self.operation, self.extent_type, self.extent_one.round(4), self.extent_two.round(4)),
+            str(self.profile)])
 
     def transform(self, translation, scale):
         """linear transformation"""
@@ -230,6 +247,8 @@ class Extrude(object):
 
 class CADSequence(object):
     """A CAD modeling sequence, a series of extrude operations."""
+    __slots__ = ("seq", "bbox")
+
     def __init__(self, extrude_seq, bbox=None):
         self.seq = extrude_seq
         self.bbox = bbox
@@ -260,10 +279,7 @@ class CADSequence(object):
         return cad_seq
 
     def __str__(self):
-        res = ""
-        for i, ext in enumerate(self.seq):
-            res += "({})".format(i) + str(ext) + "\n"
-        return res
+        return "".join("({}){}\n".format(i, ext) for i, ext in enumerate(self.seq))
 
     def to_vector(self, max_n_ext=10, max_n_loops=6, max_len_loop=15, max_total_len=60, pad=False):
         if len(self.seq) > max_n_ext:
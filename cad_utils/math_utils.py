@@ -73,6 +73,14 @@ def rotate_by_z(vec, phi):
     return np.dot(mat, vec)
 
 
+def reference_x_axis(theta, phi):
+    """x-axis of the standard coordinate system after rotating by theta about y and then by phi about z.
+    Closed form of rotate_by_z(rotate_by_y(np.array([1, 0, 0]), theta), phi).
+    NOTE: adding to 0.0 turns -0.0 into 0.0, matching the zeros the matrix product gives (e.g. theta=0)."""
+    cos_theta = math.cos(theta)
+    return np.array([cos_theta * math.cos(phi), 0.0 + cos_theta * math.sin(phi), 0.0 - math.sin(theta)])
+
+
 def polar_parameterization(normal_3d, x_axis_3d):
     """represent a coordinate system by its rotation from the standard 3D coordinate system
 
@@ -87,7 +95,7 @@ def polar_parameterization(normal_3d, x_axis_3d):
     theta = normal_polar[0]
     phi = normal_polar[1]
 
-    ref_x = rotate_by_z(rotate_by_y(np.array([1, 0, 0]), theta), phi)
+    ref_x = reference_x_axis(theta, phi)
 
     gamma = np.arccos(np.dot(x_axis_3d, ref_x).round(6))
     if np.dot(np.cross(ref_x, x_axis_3d), normal_3d) < 0:
@@ -98,7 +106,7 @@ def polar_parameterization(normal_3d, x_axis_3d):
 def polar_parameterization_inverse(theta, phi, gamma):
     """build a coordinate system by the given rotation from the standard 3D coordinate system"""
     normal_3d = polar2cartesian([theta, phi])
-    ref_x = rotate_by_z(rotate_by_y(np.array([1, 0, 0]), theta), phi)
+    ref_x = reference_x_axis(theta, phi)
     ref_y = np.cross(normal_3d, ref_x)
     x_axis_3d = ref_x * np.cos(gamma) + ref_y * np.sin(gamma)
     return normal_3d, x_axis_3d
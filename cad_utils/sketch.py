@@ -10,6 +10,7 @@ from .macro import *
 ##########################   base  ###########################
 class SketchBase(object):
     """Base class for sketch_inventor (a collection of curves). """
+    __slots__ = ("children",)
 
     def __init__(self, children, reorder=True):
         self.children = children
@@ -119,6 +120,7 @@ class SketchBase(object):
 ####################### loop & profile #######################
 class Loop(SketchBase):
     """Sketch loop, a sequence of connected curves."""
+    __slots__ = ("is_outer",)
 
     @staticmethod
     def from_dict(stat):
@@ -128,10 +130,7 @@ class Loop(SketchBase):
         return this_loop
 
     def __str__(self):
-        s = "Loop:"
-        for curve in self.children:
-            s += "\n      -" + str(curve)
-        return s
+        return "\n      -".join(["Loop:"] + [str(curve) for curve in self.children])
 
     @staticmethod
     def from_vector(vec, start_point=None, is_numerical=True):
@@ -216,6 +215,7 @@ class Loop(SketchBase):
 class Profile(SketchBase):
     """Sketch profile，a closed region formed by one or more loops. 
     The outer-most loop is placed at first."""
+    __slots__ = ()
 
     @staticmethod
     def from_dict(stat):
@@ -223,10 +223,7 @@ class Profile(SketchBase):
         return Profile(all_loops)
 
     def __str__(self):
-        s = "Profile:"
-        for loop in self.children:
-            s += "\n    -" + str(loop)
-        return s
+        return "\n    -".join(["Profile:"] + [str(loop) for loop in self.children])
 
     @staticmethod
     def from_vector(vec, start_point=None, is_numerical=True):
@@ -1,4 +1,6 @@
+import logging
 from enum import Enum
+from types import SimpleNamespace
 
 import numpy as np
 import win32com.client
@@ -6,7 +8,20 @@ from win32com.client import constants
 from win32com.client.gencache import EnsureDispatch
 
 from cad_utils.curves import Line, Circle, Arc
-from cad_utils.macro import EXTENT_TYPE, EXTRUDE_OPERATIONS
+from cad_utils.macro import EXTENT_TYPE, EXTRUDE_OPERATIONS, EOS_IDX
+
+_log = logging.getLogger(__name__)
+
+
+_INVENTOR_DISPATCH_ENSURED = False
+
+
+def ensure_inventor_dispatch():
+    # generating / loading the gencache wrappers only has to happen once per process
+    global _INVENTOR_DISPATCH_ENSURED
+    if not _INVENTOR_DISPATCH_ENSURED:
+        EnsureDispatch("Inventor.Application")
+        _INVENTOR_DISPATCH_ENSURED = True
 
 
 def get_inventor_application():
@@ -14,18 +29,42 @@ def get_inventor_application():
         # Get the Inventor application object.
 
         inv_app = win32com.client.GetActiveObject("Inventor.Application")
-        EnsureDispatch("Inventor.Application")
+        ensure_inventor_dispatch()
     except:
         try:
-            print("Warning: Unable to get active Inventor.Application object.")
+            _log.warning("Unable to get active Inventor.Application object.")
             inv_app = win32com.client.Dispatch("Inventor.Application")
-            EnsureDispatch("Inventor.Application")
+            ensure_inventor_dispatch()
         except:
-            print("Error: Unable to get Inventor.Application object.")
+            _log.error("Unable to get Inventor.Application object.")
             return None
     return inv_app
 
 
+_INVENTOR_ENUMS = None
+
+
+def inventor_enums():
+    # win32com only fills `constants` once the Inventor type library is loaded,
+    # so the values are read on first use and reused afterwards.
+    global _INVENTOR_ENUMS
+    if _INVENTOR_ENUMS is None:
+        _INVENTOR_ENUMS = SimpleNamespace(
+            kPartDocumentObject=constants.kPartDocumentObject,
+            # indexed by ExtrudeType.value / ExtrudeDirection.value
+            extrude_operations=(None,
+                                constants.kJoinOperation,
+                                constants.kCutOperation,
+                                constants.kNewBodyOperation,
+                                constants.kIntersectOperation),
+            extent_directions=(None,
+                               constants.kPositiveExtentDirection,
+                               constants.kNegativeExtentDirection,
+                               constants.kSymmetricExtentDirection),
+        )
+    return _INVENTOR_ENUMS
+
+
 def create_inventor_model_from_sequence(seq, app=None):
     part, com_def = add_part_document(app)
     for extrude_op in seq:
@@ -39,16 +78,7 @@ class ExtrudeType(Enum):
     Intersect = 4
 
     def get_type(self):
-        extrude_type = self
-        ext_type_inventor = constants.kNewBodyOperation
-        if extrude_type == ExtrudeType.Join:
-            ext_type_inventor = constants.kJoinOperation
-        elif extrude_type == ExtrudeType.Cut:
-            ext_type_inventor = constants.kCutOperation
-        elif extrude_type == ExtrudeType.Intersect:
-            ext_type_inventor = constants.kIntersectOperation
-
-        return ext_type_inventor
+        return inventor_enums().extrude_operations[self.value]
 
 
 class ExtrudeDirection(Enum):
@@ -57,21 +87,14 @@ class ExtrudeDirection(Enum):
     Symmetric = 3
 
     def get_direction(self):
-        extrude_dir = self
-        ext_dir_inventor = constants.kPositiveExtentDirection
-        if extrude_dir == ExtrudeDirection.Negative:
-            ext_dir_inventor = constants.kNegativeExtentDirection
-        elif extrude_dir == ExtrudeDirection.Symmetric:
-            ext_dir_inventor = constants.kSymmetricExtentDirection
-
-        return ext_dir_inventor
+        return inventor_enums().extent_directions[self.value]
 
 
 def add_part_document(app):
     if app is None:
         app = get_inventor_application()
 
-    part = app.Documents.Add(constants.kPartDocumentObject, "", True)
+    part = app.Documents.Add(inventor_enums().kPartDocumentObject, "", True)
     part = win32com.client.CastTo(part, "PartDocument")
     com_def = part.ComponentDefinition
     return part, com_def
@@ -107,9 +130,10 @@ def add_sketch2d_circle(sketch, center, radius):
 
 
 def add_work_plane(com_def, origin, x_axis, y_axis):
-    origin = transient_point_3d(com_def.Application, *origin)
-    x_axis = transient_unit_vector_3d(com_def.Application, *x_axis)
-    y_axis = transient_unit_vector_3d(com_def.Application, *y_axis)
+    app = com_def.Application
+    origin = transient_point_3d(app, *origin)
+    x_axis = transient_unit_vector_3d(app, *x_axis)
+    y_axis = transient_unit_vector_3d(app, *y_axis)
     work_plane = com_def.WorkPlanes.AddFixed(origin, x_axis, y_axis)
     return work_plane
 
@@ -150,29 +174,31 @@ def convert_to_extrude_inventor(com_def, extrude_op):
     return extrude_def
 
 
+_EXTRUDE_TYPE_BY_OPERATION = {
+    EXTRUDE_OPERATIONS.index("NewBodyFeatureOperation"): ExtrudeType.NewBody,
+    EXTRUDE_OPERATIONS.index("JoinFeatureOperation"): ExtrudeType.Join,
+    EXTRUDE_OPERATIONS.index("CutFeatureOperation"): ExtrudeType.Cut,
+    EXTRUDE_OPERATIONS.index("IntersectFeatureOperation"): ExtrudeType.Intersect,
+}
+
+_EXTRUDE_DIR_BY_EXTENT_TYPE = {
+    EXTENT_TYPE.index("OneSideFeatureExtentType"): ExtrudeDirection.Positive,
+    EXTENT_TYPE.index("SymmetricFeatureExtentType"): ExtrudeDirection.Symmetric,
+    EXTENT_TYPE.index("TwoSidesFeatureExtentType"): ExtrudeDirection.Symmetric,
+}
+
+
 def convert_extrude_op_to_inventor(operation):
-    if operation == EXTRUDE_OPERATIONS.index("NewBodyFeatureOperation"):
-        extrude_type = ExtrudeType.NewBody
-    elif operation == EXTRUDE_OPERATIONS.index("JoinFeatureOperation"):
-        extrude_type = ExtrudeType.Join
-    elif operation == EXTRUDE_OPERATIONS.index("CutFeatureOperation"):
-        extrude_type = ExtrudeType.Cut
-    elif operation == EXTRUDE_OPERATIONS.index("IntersectFeatureOperation"):
-        extrude_type = ExtrudeType.Intersect
-    else:
+    extrude_type = _EXTRUDE_TYPE_BY_OPERATION.get(operation)
+    if extrude_type is None:
         raise ValueError("Invalid operation")
 
     return extrude_type
 
 
 def convert_extrude_dir_to_inventor(direction):
-    if direction == EXTENT_TYPE.index("OneSideFeatureExtentType"):
-        extrude_dir = ExtrudeDirection.Positive
-    elif direction == EXTENT_TYPE.index("SymmetricFeatureExtentType"):
-        extrude_dir = ExtrudeDirection.Symmetric
-    elif direction == EXTENT_TYPE.index("TwoSidesFeatureExtentType"):
-        extrude_dir = ExtrudeDirection.Symmetric
-    else:
+    extrude_dir = _EXTRUDE_DIR_BY_EXTENT_TYPE.get(direction)
+    if extrude_dir is None:
         raise ValueError("Invalid direction")
 
     return extrude_dir
@@ -183,34 +209,51 @@ def add_extrude_feature(com_def, extrude_def):
     return extrude_feature
 
 
-def convert_to_inventor_curve(curve, sketch):
-    if isinstance(curve, Line):
-        if np.allclose(curve.start_point, curve.end_point):
-            return -1
-        start_point = transient_point_2d(sketch.Application, *curve.start_point)
-        end_point = transient_point_2d(sketch.Application, *curve.end_point)
-        curve_inv = add_sketch2d_line(sketch, start_point, end_point)
-    elif isinstance(curve, Circle):
-        center = transient_point_2d(sketch.Application, *curve.center)
-        radius = curve.radius
-        curve_inv = add_sketch2d_circle(sketch, center, radius)
-    elif isinstance(curve, Arc):
-        start_point = transient_point_2d(sketch.Application, *curve.start_point)
-        mid_point = transient_point_2d(sketch.Application, *curve.mid_point)
-        end_point = transient_point_2d(sketch.Application, *curve.end_point)
-        curve_inv = sketch.SketchArcs.AddByThreePoints(start_point, mid_point, end_point)
-    else:
+def _add_inventor_line(curve, sketch, transient_geometry):
+    sx, sy = curve.start_point.tolist()
+    ex, ey = curve.end_point.tolist()
+    # np.allclose tolerances, without the array machinery for two coordinates
+    if abs(sx - ex) <= 1e-8 + 1e-5 * abs(ex) and abs(sy - ey) <= 1e-8 + 1e-5 * abs(ey):
+        return -1
+    create_point_2d = transient_geometry.CreatePoint2d
+    start_point = create_point_2d(sx, sy)
+    end_point = create_point_2d(ex, ey)
+    return add_sketch2d_line(sketch, start_point, end_point)
+
+
+def _add_inventor_circle(curve, sketch, transient_geometry):
+    center = transient_geometry.CreatePoint2d(*curve.center.tolist())
+    return add_sketch2d_circle(sketch, center, float(curve.radius))
+
+
+def _add_inventor_arc(curve, sketch, transient_geometry):
+    create_point_2d = transient_geometry.CreatePoint2d
+    start_point = create_point_2d(*curve.start_point.tolist())
+    mid_point = create_point_2d(*curve.mid_point.tolist())
+    end_point = create_point_2d(*curve.end_point.tolist())
+    return sketch.SketchArcs.AddByThreePoints(start_point, mid_point, end_point)
+
+
+# points are numpy arrays; the handlers pass COM plain floats via tolist()
+_CURVE_TO_INVENTOR = {Line: _add_inventor_line, Circle: _add_inventor_circle, Arc: _add_inventor_arc}
+
+
+def convert_to_inventor_curve(curve, sketch, transient_geometry=None):
+    add_curve = _CURVE_TO_INVENTOR.get(type(curve))
+    if add_curve is None:
         raise NotImplementedError(type(curve))
-    return curve_inv
-    pass
+    if transient_geometry is None:
+        transient_geometry = sketch.Application.TransientGeometry
+    return add_curve(curve, sketch, transient_geometry)
 
 
 def convert_to_inventor_profile(sketch_inventor, profile):
+    transient_geometry = sketch_inventor.Application.TransientGeometry
     for loop in profile.children:
         curves = []
         curves_inv = []
         for curve in loop.children:
-            curve_inv = convert_to_inventor_curve(curve, sketch_inventor)
+            curve_inv = convert_to_inventor_curve(curve, sketch_inventor, transient_geometry)
             if len(curves) != 0 and not isinstance(curve, Circle):
                 curves_inv[-1].EndSketchPoint.Merge(curve_inv.StartSketchPoint)
             curves.append(curve)
@@ -224,8 +267,8 @@ def convert_to_inventor_profile(sketch_inventor, profile):
 
 
 def remove_padding(vec):
-    commands = vec[:, 0].tolist()
-    if 3 in commands:
-        seq_len = commands.index(3)
+    is_eos = vec[:, 0] == EOS_IDX
+    if is_eos.any():
+        seq_len = int(np.argmax(is_eos))
         vec = vec[:seq_len]
     return vec